@@ -7,10 +7,12 @@
 
 from io import BufferedReader
 import struct
-from typing import Tuple
+from typing import Tuple, Union
 
 from libmidi.utils.bytes import get_data_from_bytes
 
+_CHUNK_HEADER = struct.Struct('>4sL')
+
 class Chunk:
 	"""
 	Class representing a MIDI chunk.
@@ -18,7 +20,11 @@ class Chunk:
 	A MIDI chunk is a sequence of bytes that starts with a 4-byte
 	string, followed by a 32-bit integer representing the size of the following data.
 	"""
-	def __init__(self, name: bytes, data: bytes):
+	__slots__ = ('name', 'data')
+
+	HEADER_SIZE = _CHUNK_HEADER.size
+
+	def __init__(self, name: bytes, data: Union[bytes, memoryview]):
 		"""Initialize a chunk."""
 		self.name = name
 		self.data = data
@@ -28,26 +34,43 @@ class Chunk:
 		return f"Chunk(name={self.name}, length={self.get_length()})"
 
 	@classmethod
-	def from_bytes(cls, data: bytes) -> Tuple['Chunk', bytes]:
+	def from_bytes(cls, data: Union[bytes, memoryview]) -> Tuple['Chunk', memoryview]:
 		"""Read a chunk from bytes."""
-		chunk_header, remaining_data = get_data_from_bytes(data, 8)
-		name, length = struct.unpack('>4sL', chunk_header)
-		chunk_data, remaining_data = get_data_from_bytes(data, length)
+		chunk_header, remaining_data = get_data_from_bytes(data, _CHUNK_HEADER.size)
+		name, length = _CHUNK_HEADER.unpack(chunk_header)
+		chunk_data, remaining_data = get_data_from_bytes(remaining_data, length)
 
 		return Chunk(name, chunk_data), remaining_data
 
+	@classmethod
+	def from_buffer(cls, buffer: Union[bytes, memoryview], offset: int = 0) -> Tuple['Chunk', int]:
+		"""
+		Read a chunk from a buffer (bytes, memoryview, mmap...) at the given offset.
+
+		Returns the chunk and the offset following it.
+		"""
+		name, length = _CHUNK_HEADER.unpack_from(buffer, offset)
+		offset += _CHUNK_HEADER.size
+
+		return Chunk(name, buffer[offset:offset + length]), offset + length
+
 	@classmethod
 	def from_stream(cls, buffer: BufferedReader) -> 'Chunk':
 		"""Read a chunk from a stream."""
-		name, length = struct.unpack('>4sL', buffer.read(8))
+		name, length = _CHUNK_HEADER.unpack(buffer.read(_CHUNK_HEADER.size))
 		data = buffer.read(length)
 
 		return Chunk(name, data)
 
+	@staticmethod
+	def pack_header_into(buffer: bytearray, offset: int, name: bytes, length: int):
+		"""Write the header of a chunk with the given name and data length into a buffer at the given offset."""
+		_CHUNK_HEADER.pack_into(buffer, offset, name, length)
+
 	def get_length(self) -> int:
 		"""Return length of data."""
 		return len(self.data)
 
 	def to_bytes(self) -> bytes:
 		"""Return chunk as bytes."""
-		return struct.pack('>4sL', self.name, self.get_length()) + self.data
+		return _CHUNK_HEADER.pack(self.name, self.get_length()) + self.data
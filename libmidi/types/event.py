@@ -5,7 +5,7 @@
 #
 """MIDI event."""
 
-from typing import Tuple
+from typing import Tuple, Union
 
 from libmidi.types.message import BaseMessage, message_from_bytes
 from libmidi.utils.variable_length import VariableInt
@@ -17,6 +17,8 @@ class Event:
 	A MIDI event is a sequence of bytes that starts with a variable int delta time,
 	followed by a MIDI message.
 	"""
+	__slots__ = ('delta_time', 'message')
+
 	def __init__(self, delta_time: int, message: BaseMessage):
 		"""Initialize an event."""
 		self.delta_time = delta_time
@@ -36,10 +38,11 @@ class Event:
 		return Event(**kwargs)
 
 	@classmethod
-	def from_bytes(cls, data: bytes, last_status_byte: int = None) -> Tuple['Event', bytes]:
+	def from_bytes(cls, data: Union[bytes, memoryview], last_status_byte: int = None) -> Tuple['Event', memoryview]:
 		"""Read an event from bytes."""
-		delta_time, data = VariableInt.from_bytes(data)
-		message, remaining_data = message_from_bytes(data, last_status_byte)
+		data = memoryview(data)
+		delta_time, offset = VariableInt.from_buffer(data)
+		message, remaining_data = message_from_bytes(data[offset:], last_status_byte)
 
 		return cls(delta_time, message), remaining_data
 
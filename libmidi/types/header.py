@@ -7,10 +7,14 @@
 
 from io import BufferedReader, BufferedWriter
 import struct
-from typing import Tuple
+from typing import Tuple, Union
 
 from libmidi.types.chunk import Chunk
 
+_HEADER_DATA = struct.Struct('>HHH')
+# Whole MThd chunk: chunk header + header data
+_HEADER_CHUNK = struct.Struct('>4sLHHH')
+
 class Header(object):
 	"""
 	Class representing a MIDI header.
@@ -24,6 +28,8 @@ class Header(object):
 	- ntrks: Number of tracks in the file.
 	- division: The number of ticks per quarter note.
 	"""
+	__slots__ = ('format', 'ntrks', 'division')
+
 	HEADER = b'MThd'
 
 	def __init__(self, format: int, ntrks: int, division: int):
@@ -33,34 +39,47 @@ class Header(object):
 		self.division = division
 
 	@classmethod
-	def from_bytes(cls, data: bytes) -> Tuple['Header', bytes]:
+	def from_bytes(cls, data: Union[bytes, memoryview]) -> Tuple['Header', memoryview]:
 		chunk, remaining_bytes = Chunk.from_bytes(data)
 
 		assert chunk.name == cls.HEADER, "Expected MThd chunk"
-		assert len(chunk.data) == 6, "Expected 6 bytes in MThd chunk"
+		assert len(chunk.data) == _HEADER_DATA.size, "Expected 6 bytes in MThd chunk"
 
-		format, ntrks, division = struct.unpack(">HHH", chunk.data)
+		format, ntrks, division = _HEADER_DATA.unpack(chunk.data)
 
 		return cls(format, ntrks, division), remaining_bytes
 
+	@classmethod
+	def from_buffer(cls, buffer: Union[bytes, memoryview], offset: int = 0) -> Tuple['Header', int]:
+		"""
+		Read header from a buffer at the given offset.
+
+		Returns the header and the offset following it.
+		"""
+		chunk, offset = Chunk.from_buffer(buffer, offset)
+
+		assert chunk.name == cls.HEADER, "Expected MThd chunk"
+		assert len(chunk.data) == _HEADER_DATA.size, "Expected 6 bytes in MThd chunk"
+
+		format, ntrks, division = _HEADER_DATA.unpack_from(chunk.data)
+
+		return cls(format, ntrks, division), offset
+
 	@classmethod
 	def from_stream(cls, stream: BufferedReader) -> 'Header':
 		"""Read header from stream."""
 		chunk = Chunk.from_stream(stream)
 
 		assert chunk.name == cls.HEADER, "Expected MThd chunk"
-		assert len(chunk.data) == 6, "Expected 6 bytes in MThd chunk"
+		assert len(chunk.data) == _HEADER_DATA.size, "Expected 6 bytes in MThd chunk"
 
-		format, ntrks, division = struct.unpack(">HHH", chunk.data)
+		format, ntrks, division = _HEADER_DATA.unpack(chunk.data)
 
 		return cls(format, ntrks, division)
 
 	def to_bytes(self) -> bytes:
 		"""Return header as bytes."""
-		# TODO: wtf? division and ntrks needs to be swapped?
-		data = struct.pack(">HHH", self.format, self.division, self.ntrks)
-		chunk = Chunk(name=self.HEADER, data=data)
-		return chunk.to_bytes()
+		return _HEADER_CHUNK.pack(self.HEADER, _HEADER_DATA.size, self.format, self.ntrks, self.division)
 
 	def to_stream(self, stream: BufferedWriter) -> int:
 		"""
@@ -5,38 +5,66 @@
 #
 """MIDI message."""
 
-from typing import Tuple
+from functools import partial
+from typing import Callable, List, Tuple, Union
 
 from libmidi.types.messages.common import BaseMessage
-from libmidi.types.messages.channel import ALL_CHANNEL_MESSAGE_TYPES, channel_message_from_bytes
-from libmidi.types.messages.system import ALL_SYSTEM_MESSAGE_TYPES, system_message_from_bytes
+from libmidi.types.messages.channel import STATUS_DISPATCH
+from libmidi.types.messages.system import SYSTEM_MESSAGE_TYPES
 from libmidi.types.messages.meta import META_MESSAGE_VALUE, meta_message_from_bytes
 
-def message_from_bytes(data: bytes, last_status_byte: int) -> Tuple[BaseMessage, bytes]:
+MessageDecoder = Callable[[Union[bytes, memoryview]], Tuple[BaseMessage, memoryview]]
+
+def _invalid_message_from_bytes(data: Union[bytes, memoryview]) -> Tuple[BaseMessage, memoryview]:
+	raise ValueError(f"Invalid message status byte: 0x{data[0]:02x}")
+
+def _invalid_running_status_from_bytes(data: Union[bytes, memoryview]) -> Tuple[BaseMessage, memoryview]:
+	raise ValueError("Running status without a previous channel message")
+
+def _get_message_decoder(status_byte: int) -> MessageDecoder:
+	"""Return the function that decodes messages starting with the given status byte."""
+	channel_message_class = STATUS_DISPATCH[status_byte]
+	if channel_message_class:
+		return channel_message_class.from_bytes
+	# Resolve system messages to their class here too, skipping the SYSTEM_MESSAGE_TYPES
+	# lookup system_message_from_bytes() would do for every message
+	system_message_class = SYSTEM_MESSAGE_TYPES.get(status_byte)
+	if system_message_class:
+		return system_message_class.from_bytes
+	if status_byte == META_MESSAGE_VALUE:
+		return meta_message_from_bytes
+
+	return _invalid_message_from_bytes
+
+def _get_running_status_decoder(status_byte: int) -> MessageDecoder:
+	"""Return the function that decodes messages without status byte following the given one."""
+	channel_message_class = STATUS_DISPATCH[status_byte]
+	if channel_message_class:
+		return partial(channel_message_class.from_bytes, status_byte=status_byte)
+
+	# Only channel messages can omit their status byte
+	return _invalid_running_status_from_bytes
+
+# Status byte -> message decoder, so that dispatching is a single list index.
+# Every entry is callable, invalid ones raise ValueError
+MESSAGE_DISPATCH: List[MessageDecoder] = [
+	_get_message_decoder(status_byte) for status_byte in range(256)
+]
+
+# Same, indexed by the last status byte, for messages using running status
+RUNNING_STATUS_DISPATCH: List[MessageDecoder] = [
+	_get_running_status_decoder(status_byte) for status_byte in range(256)
+]
+
+def message_from_bytes(data: Union[bytes, memoryview], last_status_byte: int) -> Tuple[BaseMessage, memoryview]:
 	"""
 	Get a message object from bytes.
 
 	Returns the message object and the remaining bytes.
 	"""
-	message: BaseMessage = None
-	remaining_data = None
-
 	message_status = data[0]
 	if message_status < 0x80:
-		# Running status
-		message_status = last_status_byte
-		data = last_status_byte.to_bytes(1, 'big') + data[:]
-
-	message_type = message_status >> 4
-
-	if message_type in ALL_CHANNEL_MESSAGE_TYPES:
-		message, remaining_data = channel_message_from_bytes(data)
-	elif message_status in ALL_SYSTEM_MESSAGE_TYPES:
-		message, remaining_data = system_message_from_bytes(data)
-	elif message_status == META_MESSAGE_VALUE:
-		message, remaining_data = meta_message_from_bytes(data)
-
-	if not message:
-		raise ValueError("Invalid message")
+		# Running status, no status byte to consume
+		return RUNNING_STATUS_DISPATCH[last_status_byte or 0](data)
 
-	return message, remaining_data
+	return MESSAGE_DISPATCH[message_status](data)
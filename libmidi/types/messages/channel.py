@@ -6,10 +6,10 @@
 """MIDI channel message."""
 
 from enum import IntEnum
+from operator import attrgetter
 import struct
-from typing import Tuple
+from typing import Callable, Dict, List, Optional, Tuple, Type, Union
 
-from libmidi.utils.bytes import get_data_from_bytes
 from libmidi.types.messages.common import BaseMessage, MessageType
 
 class ChannelMessageType(IntEnum):
@@ -22,7 +22,7 @@ class ChannelMessageType(IntEnum):
 	CHANNEL_AFTERTOUCH = 0xD
 	PITCH_BEND = 0xE
 
-ALL_CHANNEL_MESSAGE_TYPES = [
+ALL_CHANNEL_MESSAGE_TYPES = frozenset({
 	ChannelMessageType.NOTE_OFF,
 	ChannelMessageType.NOTE_ON,
 	ChannelMessageType.AFTERTOUCH,
@@ -30,7 +30,7 @@ ALL_CHANNEL_MESSAGE_TYPES = [
 	ChannelMessageType.PROGRAM_CHANGE,
 	ChannelMessageType.CHANNEL_AFTERTOUCH,
 	ChannelMessageType.PITCH_BEND,
-]
+})
 
 class BaseMessageChannel(BaseMessage):
 	"""
@@ -40,8 +40,34 @@ class BaseMessageChannel(BaseMessage):
 	8 bit data bytes), we can commonize a lot of methods.
 	"""
 
+	__slots__ = ('channel',)
+
 	message_type = MessageType.CHANNEL
-	channel_message_type: ChannelMessageType
+	# Plain int rather than ChannelMessageType, it's used in status byte arithmetic
+	channel_message_type: int
+
+	# Built once per message class from its attributes, see __init_subclass__()
+	_data_struct: struct.Struct
+	_struct: struct.Struct
+	_get_attribute_values: Callable[['BaseMessageChannel'], Tuple[int, ...]]
+	_length: int
+
+	def __init_subclass__(cls, **kwargs):
+		"""Precompute the structs and the attribute getter of a channel message class."""
+		super().__init_subclass__(**kwargs)
+
+		cls._data_struct = struct.Struct(f">{'B' * len(cls.attributes)}")
+		cls._struct = struct.Struct(f">B{'B' * len(cls.attributes)}")
+
+		# Status byte (which also holds the channel) + one byte per attribute
+		cls._length = cls._struct.size
+
+		# attrgetter() only returns a tuple when given more than one attribute
+		getter = attrgetter(*cls.attributes)
+		if len(cls.attributes) > 1:
+			cls._get_attribute_values = getter
+		else:
+			cls._get_attribute_values = staticmethod(lambda message: (getter(message),))
 
 	def __init__(self, channel: int):
 		"""Initialize a channel message."""
@@ -51,7 +77,7 @@ class BaseMessageChannel(BaseMessage):
 		"""Return a string representation of the message."""
 		return (
 			super().__str__()
-			+ f", channel message type: {self.channel_message_type.name}"
+			+ f", channel message type: {ChannelMessageType(self.channel_message_type).name}"
 			+ f", channel: {self.channel}"
 		)
 
@@ -66,34 +92,36 @@ class BaseMessageChannel(BaseMessage):
 		return super().copy(**kwargs)
 
 	@classmethod
-	def from_bytes(cls, data: bytes):
-		_, channel, remaining_data = cls._get_status_data(data)
+	def from_bytes(cls, data: Union[bytes, memoryview], status_byte: Optional[int] = None):
+		data = memoryview(data)
 
-		message_data, remaining_data = get_data_from_bytes(remaining_data, len(cls.attributes))
+		# Status data extraction inlined, this is the hottest decoding path
+		offset = 0
+		if status_byte is None:
+			status_byte = data[0]
+			offset = 1
 
-		zipped_data = dict(zip(cls.attributes, struct.unpack(f">{'B' * len(cls.attributes)}", message_data)))
+		if __debug__:
+			cls._assert_status_byte(status_byte)
 
-		for attr, value in zipped_data.items():
-			if 0 >= value > 127:
-				raise ValueError(f"Invalid value for {attr}")
+		# Attributes are in the same order as the constructor arguments
+		message = cls(status_byte & 0x0F, *cls._data_struct.unpack_from(data, offset))
 
-		return cls(channel, **dict(zipped_data)), remaining_data
+		return message, data[offset + cls._data_struct.size:]
 
 	def get_status_byte(self):
 		return (self.channel_message_type << 4) | self.channel
 
 	def get_length(self) -> int:
-		# status + channel + attributes
-		return super().get_length() + 1 + len(self.attributes)
+		return self._length
 
 	def to_bytes(self):
-		status_byte = self.get_status_byte()
-		message_data = struct.pack(f">{'B' * len(self.attributes)}",
-		                           *[getattr(self, attr) for attr in self.attributes])
-		return status_byte.to_bytes(1, 'big', signed=False) + message_data
+		return self._struct.pack(self.get_status_byte(), *self._get_attribute_values(self))
 
 class MessageNoteOff(BaseMessageChannel):
-	channel_message_type = ChannelMessageType.NOTE_OFF
+	__slots__ = ('note', 'velocity')
+
+	channel_message_type = ChannelMessageType.NOTE_OFF.value
 	attributes = ['note', 'velocity']
 
 	def __init__(self, channel: int, note: int, velocity: int):
@@ -104,7 +132,9 @@ class MessageNoteOff(BaseMessageChannel):
 		self.velocity = velocity
 
 class MessageNoteOn(BaseMessageChannel):
-	channel_message_type = ChannelMessageType.NOTE_ON
+	__slots__ = ('note', 'velocity')
+
+	channel_message_type = ChannelMessageType.NOTE_ON.value
 	attributes = ['note', 'velocity']
 
 	def __init__(self, channel: int, note: int, velocity: int):
@@ -115,7 +145,9 @@ class MessageNoteOn(BaseMessageChannel):
 		self.velocity = velocity
 
 class MessageAftertouch(BaseMessageChannel):
-	channel_message_type = ChannelMessageType.AFTERTOUCH
+	__slots__ = ('note', 'value')
+
+	channel_message_type = ChannelMessageType.AFTERTOUCH.value
 	attributes = ['note', 'value']
 
 	def __init__(self, channel: int, note: int, value: int):
@@ -126,7 +158,9 @@ class MessageAftertouch(BaseMessageChannel):
 		self.value = value
 
 class MessageControlChange(BaseMessageChannel):
-	channel_message_type = ChannelMessageType.CONTROL_CHANGE
+	__slots__ = ('control', 'value')
+
+	channel_message_type = ChannelMessageType.CONTROL_CHANGE.value
 	attributes = ['control', 'value']
 
 	def __init__(self, channel: int, control: int, value: int):
@@ -137,7 +171,9 @@ class MessageControlChange(BaseMessageChannel):
 		self.value = value
 
 class MessageProgramChange(BaseMessageChannel):
-	channel_message_type = ChannelMessageType.PROGRAM_CHANGE
+	__slots__ = ('program',)
+
+	channel_message_type = ChannelMessageType.PROGRAM_CHANGE.value
 	attributes = ['program']
 
 	def __init__(self, channel: int, program: int):
@@ -147,7 +183,9 @@ class MessageProgramChange(BaseMessageChannel):
 		self.program = program
 
 class MessageChannelAftertouch(BaseMessageChannel):
-	channel_message_type = ChannelMessageType.CHANNEL_AFTERTOUCH
+	__slots__ = ('value',)
+
+	channel_message_type = ChannelMessageType.CHANNEL_AFTERTOUCH.value
 	attributes = ['value']
 
 	def __init__(self, channel: int, value: int):
@@ -157,7 +195,9 @@ class MessageChannelAftertouch(BaseMessageChannel):
 		self.value = value
 
 class MessagePitchBend(BaseMessageChannel):
-	channel_message_type = ChannelMessageType.PITCH_BEND
+	__slots__ = ('value_lsb', 'value_msb')
+
+	channel_message_type = ChannelMessageType.PITCH_BEND.value
 	attributes = ['value_lsb', 'value_msb']
 
 	def __init__(self, channel: int, value_lsb: int, value_msb: int):
@@ -167,32 +207,36 @@ class MessagePitchBend(BaseMessageChannel):
 		self.value_lsb = value_lsb
 		self.value_msb = value_msb
 
-		self.value = (value_msb << 7) | value_lsb
+	@property
+	def value(self) -> int:
+		"""14 bit pitch bend value, computed from the MSB and LSB."""
+		return (self.value_msb << 7) | self.value_lsb
+
+	@value.setter
+	def value(self, value: int):
+		self.value_lsb = value & 0x7F
+		self.value_msb = (value >> 7) & 0x7F
+
+CHANNEL_MESSAGE_TYPES: Dict[int, Type[BaseMessageChannel]] = {
+	ChannelMessageType.NOTE_OFF: MessageNoteOff,
+	ChannelMessageType.NOTE_ON: MessageNoteOn,
+	ChannelMessageType.AFTERTOUCH: MessageAftertouch,
+	ChannelMessageType.CONTROL_CHANGE: MessageControlChange,
+	ChannelMessageType.PROGRAM_CHANGE: MessageProgramChange,
+	ChannelMessageType.CHANNEL_AFTERTOUCH: MessageChannelAftertouch,
+	ChannelMessageType.PITCH_BEND: MessagePitchBend,
+}
+
+# Status byte -> channel message class, so that dispatching is a single list index
+STATUS_DISPATCH: List[Optional[Type[BaseMessageChannel]]] = [
+	CHANNEL_MESSAGE_TYPES.get(status_byte >> 4) for status_byte in range(256)
+]
 
-def channel_message_from_bytes(data: bytes) -> Tuple[BaseMessageChannel, bytes]:
+def channel_message_from_bytes(data: Union[bytes, memoryview]) -> Tuple[BaseMessageChannel, memoryview]:
 	"""Get a channel message from bytes."""
-	message: BaseMessage = None
-	remaining_data = None
-
-	message_status = data[0]
-
-	message_type = message_status >> 4
-
-	if message_type == ChannelMessageType.NOTE_OFF:
-		message, remaining_data = MessageNoteOff.from_bytes(data)
-	elif message_type == ChannelMessageType.NOTE_ON:
-		message, remaining_data = MessageNoteOn.from_bytes(data)
-	elif message_type == ChannelMessageType.AFTERTOUCH:
-		message, remaining_data = MessageAftertouch.from_bytes(data)
-	elif message_type == ChannelMessageType.CONTROL_CHANGE:
-		message, remaining_data = MessageControlChange.from_bytes(data)
-	elif message_type == ChannelMessageType.PROGRAM_CHANGE:
-		message, remaining_data = MessageProgramChange.from_bytes(data)
-	elif message_type == ChannelMessageType.CHANNEL_AFTERTOUCH:
-		message, remaining_data = MessageChannelAftertouch.from_bytes(data)
-	elif message_type == ChannelMessageType.PITCH_BEND:
-		message, remaining_data = MessagePitchBend.from_bytes(data)
-	else:
-		raise ValueError(f"Unknown channel message type: 0x{message_type:x}")
-
-	return message, remaining_data
+	message_class = STATUS_DISPATCH[data[0]]
+
+	if not message_class:
+		raise ValueError(f"Unknown channel message type: 0x{data[0] >> 4:x}")
+
+	return message_class.from_bytes(data)
@@ -6,7 +6,7 @@
 """MIDI message."""
 
 from enum import Enum
-from typing import List, Tuple
+from typing import List, Tuple, Union
 
 from libmidi.utils.bytes import get_data_from_bytes
 
@@ -16,6 +16,9 @@ class MessageType(Enum):
 	META = 2
 
 class BaseMessage:
+	# Subclasses declare their attributes as slots, so that messages don't carry a __dict__
+	__slots__ = ()
+
 	message_type: MessageType
 	attributes: List[str] = []
 
@@ -24,7 +27,7 @@ class BaseMessage:
 		raise NotImplementedError
 
 	@classmethod
-	def from_bytes(cls, data: bytes) -> Tuple['BaseMessage', bytes]:
+	def from_bytes(cls, data: Union[bytes, memoryview]) -> Tuple['BaseMessage', memoryview]:
 		"""Read a message from bytes."""
 		raise NotImplementedError
 
@@ -54,7 +57,7 @@ class BaseMessage:
 		return 1
 
 	@classmethod
-	def _get_status_data(cls, data: bytes) -> Tuple[int, int, bytes]:
+	def _get_status_data(cls, data: Union[bytes, memoryview]) -> Tuple[int, int, memoryview]:
 		status_bytes, remaining_data = get_data_from_bytes(data, 1)
 		status_byte = status_bytes[0]
 		cls._assert_status_byte(status_byte)
@@ -6,15 +6,22 @@
 """MIDI meta message."""
 
 from enum import IntEnum
-from typing import Tuple
+from typing import Dict, Optional, Tuple, Type, Union
 import struct
 
-from libmidi.utils.bytes import get_data_from_bytes
 from libmidi.types.messages.common import BaseMessage, MessageType
 from libmidi.utils.variable_length import VariableInt
 
 META_MESSAGE_VALUE = 0xFF
 
+# Status byte + meta message type byte, the data length VLQ is not included
+_META_HEADER_LENGTH = 2
+
+_SEQUENCE_NUMBER_STRUCT = struct.Struct('>H')
+_SMPTE_OFFSET_STRUCT = struct.Struct('>BBBBB')
+_TIME_SIGNATURE_STRUCT = struct.Struct('>BBBB')
+_KEY_SIGNATURE_STRUCT = struct.Struct('>BB')
+
 class MetaMessageType(IntEnum):
 	"""Enum of meta message types."""
 	UNKNOWN = -1
@@ -34,7 +41,7 @@ class MetaMessageType(IntEnum):
 	KEY_SIGNATURE = 0x59
 	SEQUENCER_SPECIFIC = 0x7F
 
-ALL_META_MESSAGE_TYPES = [
+ALL_META_MESSAGE_TYPES = frozenset({
 	MetaMessageType.TEXT,
 	MetaMessageType.COPYRIGHT_NOTICE,
 	MetaMessageType.TRACK_NAME,
@@ -49,18 +56,28 @@ ALL_META_MESSAGE_TYPES = [
 	MetaMessageType.TIME_SIGNATURE,
 	MetaMessageType.KEY_SIGNATURE,
 	MetaMessageType.SEQUENCER_SPECIFIC,
-]
+})
+
+# Meta message type value -> name, for printing
+_META_NAMES: Dict[int, str] = {meta_message_type.value: meta_message_type.name for meta_message_type in MetaMessageType}
 
 class BaseMessageMeta(BaseMessage):
 	"""Base class for all meta messages."""
+
+	__slots__ = ()
+
 	message_type = MessageType.META
-	meta_message_type: MetaMessageType
+	# Plain int rather than MetaMessageType, it's compared and packed for every message
+	meta_message_type: int
+
+	# Messages with fixed size data override it, the others override get_length()
+	_length = _META_HEADER_LENGTH
 
 	def __str__(self) -> str:
 		"""Return a string representation of the message."""
 		return (
 			super().__str__()
-			+ f", meta message type: {self.meta_message_type.name}"
+			+ f", meta message type: {_META_NAMES[self.meta_message_type]}"
 		)
 
 	@classmethod
@@ -68,38 +85,58 @@ class BaseMessageMeta(BaseMessage):
 		assert status_byte == META_MESSAGE_VALUE, "Invalid status byte"
 
 	def get_length(self) -> int:
-		return super().get_length() + 1
+		return self._length
 
 	def get_status_byte(self) -> int:
 		return META_MESSAGE_VALUE
 
 	@classmethod
-	def _get_meta_message_data(cls, data: bytes) -> Tuple[bytes, bytes]:
-		_, _, remaining_data = cls._get_status_data(data)
+	def _assert_meta_message_type(cls, meta_message_type: int):
+		assert meta_message_type == cls.meta_message_type, (
+			f"Expected meta message type {_META_NAMES[cls.meta_message_type]}, got {meta_message_type}")
 
-		meta_message_type, remaining_data = get_data_from_bytes(remaining_data, 1)
-		meta_message_type = meta_message_type[0]
+	@classmethod
+	def _get_meta_message_data(cls, data: Union[bytes, memoryview]) -> Tuple[int, memoryview, memoryview]:
+		"""
+		Read the meta message header.
 
-		length, remaining_data = VariableInt.from_bytes(remaining_data)
+		Returns the meta message type, the message data and the remaining bytes.
+		"""
+		# Header fields are read by index, slicing only once for data and remaining bytes
+		data = memoryview(data)
 
-		if cls.meta_message_type != MetaMessageType.UNKNOWN:
-			assert meta_message_type == cls.meta_message_type, (
-				f"Expected meta message type {cls.meta_message_type.name}, got {meta_message_type}")
-		elif meta_message_type in ALL_META_MESSAGE_TYPES:
-			raise Exception("Using unknown meta message type on a well known type")
+		cls._assert_status_byte(data[0])
 
-		data, remaining_data = get_data_from_bytes(remaining_data, length)
+		meta_message_type = data[1]
+		cls._assert_meta_message_type(meta_message_type)
 
-		return meta_message_type, data, remaining_data
+		# Length is a variable-length quantity, but it almost always fits in one byte
+		length = data[2]
+		offset = 3
+		if length >= 0x80:
+			length, offset = VariableInt.from_buffer(data, 2)
+
+		end = offset + length
+
+		return meta_message_type, data[offset:end], data[end:]
 
 	def _header_to_bytes(self) -> bytes:
-		return bytes(
-			struct.pack(">BB", self.get_status_byte(), self.meta_message_type.value)
-			+ VariableInt.to_bytes(self.get_length() - 2)
-		)
+		return self._make_header_bytes(self.meta_message_type)
+
+	def _make_header_bytes(self, type_byte: int) -> bytes:
+		length = self.get_length() - _META_HEADER_LENGTH
+
+		# The length is almost always a single byte VLQ, build the 3 bytes at once
+		if length < 0x80:
+			return bytes((META_MESSAGE_VALUE, type_byte, length))
+
+		return bytes((META_MESSAGE_VALUE, type_byte)) + VariableInt.to_bytes(length)
 
 class MessageMetaSequenceNumber(BaseMessageMeta):
-	meta_message_type = MetaMessageType.SEQUENCE_NUMBER
+	__slots__ = ('sequence_number',)
+
+	meta_message_type = MetaMessageType.SEQUENCE_NUMBER.value
+	_length = _META_HEADER_LENGTH + 2
 	attributes = ['sequence_number']
 
 	def __init__(self, sequence_number: int):
@@ -107,68 +144,115 @@ class MessageMetaSequenceNumber(BaseMessageMeta):
 		self.sequence_number = sequence_number
 
 	@classmethod
-	def from_bytes(cls, data: bytes):
+	def from_bytes(cls, data: Union[bytes, memoryview]):
 		meta_message_type, data, remaining_data = cls._get_meta_message_data(data)
-		assert len(data) == 2, f"Expected 2 bytes, got {len(data)}"
-		sequence_number = int.from_bytes(data, 'big', signed=False)
+		sequence_number, = _SEQUENCE_NUMBER_STRUCT.unpack(data)
 		return cls(sequence_number), remaining_data
 
-	def get_length(self) -> int:
-		return super().get_length() + 2
-
 	def to_bytes(self) -> bytes:
 		return (
 			self._header_to_bytes()
-			+ self.sequence_number.to_bytes(2, 'big')
+			+ _SEQUENCE_NUMBER_STRUCT.pack(self.sequence_number)
 		)
 
 class BaseMessageMetaText(BaseMessageMeta):
 	"""Base class for meta messages with text."""
 
+	__slots__ = ('_text', '_text_bytes')
+
 	attributes = ['text']
 
+	_text: Optional[str]
+	_text_bytes: bytes
+
 	def __init__(self, text: str):
 		"""Initialize a meta text message."""
 		self.text = text
 
+	@property
+	def text(self) -> str:
+		# Parsed messages only keep the raw bytes, decode them on first access
+		if self._text is None:
+			self._text = str(self._text_bytes, 'ASCII', errors='ignore')
+		return self._text
+
+	@text.setter
+	def text(self, text: str):
+		self._text = text
+		# Encoded once, get_length() and to_bytes() both need it
+		self._text_bytes = text.encode('ASCII')
+
 	@classmethod
-	def from_bytes(cls, data: bytes):
+	def from_bytes(cls, data: Union[bytes, memoryview]):
 		meta_message_type, data, remaining_data = cls._get_meta_message_data(data)
-		text = data.decode('ASCII', errors='ignore')
-		return cls(text), remaining_data
+
+		# Skip __init__(), text is decoded lazily from the bytes (see text)
+		message = cls.__new__(cls)
+		message._text = None
+		message._text_bytes = bytes(data)
+
+		return message, remaining_data
+
+	def copy(self, **kwargs) -> BaseMessage:
+		if 'text' in kwargs:
+			return super().copy(**kwargs)
+
+		# Keep the raw bytes, text may not decode them losslessly
+		message = self.__class__.__new__(self.__class__)
+		message._text = self._text
+		message._text_bytes = self._text_bytes
+
+		return message
 
 	def get_length(self):
-		return super().get_length() + len(self.text.encode('ASCII'))
+		return _META_HEADER_LENGTH + len(self._text_bytes)
 
 	def to_bytes(self) -> bytes:
 		return (
 			self._header_to_bytes()
-			+ self.text.encode('ASCII')
+			+ self._text_bytes
 		)
 
 class MessageMetaText(BaseMessageMetaText):
-	meta_message_type = MetaMessageType.TEXT
+	__slots__ = ()
+
+	meta_message_type = MetaMessageType.TEXT.value
 
 class MessageMetaCopyrightNotice(BaseMessageMetaText):
-	meta_message_type = MetaMessageType.COPYRIGHT_NOTICE
+	__slots__ = ()
+
+	meta_message_type = MetaMessageType.COPYRIGHT_NOTICE.value
 
 class MessageMetaTrackName(BaseMessageMetaText):
-	meta_message_type = MetaMessageType.TRACK_NAME
+	__slots__ = ()
+
+	meta_message_type = MetaMessageType.TRACK_NAME.value
 
 class MessageMetaInstrumentName(BaseMessageMetaText):
-	meta_message_type = MetaMessageType.INSTRUMENT_NAME
+	__slots__ = ()
+
+	meta_message_type = MetaMessageType.INSTRUMENT_NAME.value
 
 class MessageMetaLyric(BaseMessageMetaText):
-	meta_message_type = MetaMessageType.LYRIC
+	__slots__ = ()
+
+	meta_message_type = MetaMessageType.LYRIC.value
 
 class MessageMetaMarker(BaseMessageMetaText):
-	meta_message_type = MetaMessageType.MARKER
+	__slots__ = ()
+
+	meta_message_type = MetaMessageType.MARKER.value
 
 class MessageMetaCuePoint(BaseMessageMetaText):
-	meta_message_type = MetaMessageType.CUE_POINT
+	__slots__ = ()
+
+	meta_message_type = MetaMessageType.CUE_POINT.value
 
 class MessageMetaChannelPrefix(BaseMessageMeta):
-	meta_message_type = MetaMessageType.CHANNEL_PREFIX
+	__slots__ = ('channel_prefix',)
+
+	meta_message_type = MetaMessageType.CHANNEL_PREFIX.value
+	_length = _META_HEADER_LENGTH + 1
 	attributes = ['channel_prefix']
 
 	def __init__(self, channel_prefix: int):
@@ -176,26 +260,25 @@ class MessageMetaChannelPrefix(BaseMessageMeta):
 		self.channel_prefix = channel_prefix
 
 	@classmethod
-	def from_bytes(cls, data: bytes):
+	def from_bytes(cls, data: Union[bytes, memoryview]):
 		meta_message_type, data, remaining_data = cls._get_meta_message_data(data)
 		assert len(data) == 1, f"Expected 1 byte, got {len(data)}"
-		channel_prefix = int.from_bytes(data, 'big', signed=False)
+		channel_prefix = data[0]
 		return cls(channel_prefix), remaining_data
 
-	def get_length(self) -> int:
-		return super().get_length() + 1
-
 	def to_bytes(self) -> bytes:
 		return (
 			self._header_to_bytes()
-			+ self.channel_prefix.to_bytes(1, 'big')
+			+ bytes((self.channel_prefix,))
 		)
 
 class MessageMetaEndOfTrack(BaseMessageMeta):
-	meta_message_type = MetaMessageType.END_OF_TRACK
+	__slots__ = ()
+
+	meta_message_type = MetaMessageType.END_OF_TRACK.value
 
 	@classmethod
-	def from_bytes(cls, data: bytes):
+	def from_bytes(cls, data: Union[bytes, memoryview]):
 		meta_message_type, data, remaining_data = cls._get_meta_message_data(data)
 		return cls(), remaining_data
 
@@ -203,7 +286,10 @@ class MessageMetaEndOfTrack(BaseMessageMeta):
 		return self._header_to_bytes()
 
 class MessageMetaSetTempo(BaseMessageMeta):
-	meta_message_type = MetaMessageType.SET_TEMPO
+	__slots__ = ('tempo',)
+
+	meta_message_type = MetaMessageType.SET_TEMPO.value
+	_length = _META_HEADER_LENGTH + 3
 	attributes = ['tempo']
 
 	def __init__(self, tempo: int):
@@ -211,23 +297,23 @@ class MessageMetaSetTempo(BaseMessageMeta):
 		self.tempo = tempo
 
 	@classmethod
-	def from_bytes(cls, data: bytes):
+	def from_bytes(cls, data: Union[bytes, memoryview]):
 		meta_message_type, data, remaining_data = cls._get_meta_message_data(data)
 		assert len(data) == 3, f"Expected 3 bytes, got {len(data)}"
-		tempo = int.from_bytes(data, 'big', signed=False)
+		tempo = (data[0] << 16) | (data[1] << 8) | data[2]
 		return cls(tempo), remaining_data
 
-	def get_length(self) -> int:
-		return super().get_length() + 3
-
 	def to_bytes(self) -> bytes:
 		return (
 			self._header_to_bytes()
-			+ self.tempo.to_bytes(3, 'big', signed=False)
+			+ bytes((self.tempo >> 16, (self.tempo >> 8) & 0xFF, self.tempo & 0xFF))
 		)
 
 class MessageMetaSMPTEOffset(BaseMessageMeta):
-	meta_message_type = MetaMessageType.SMPTE_OFFSET
+	__slots__ = ('hours', 'minutes', 'seconds', 'frames', 'sub_frames')
+
+	meta_message_type = MetaMessageType.SMPTE_OFFSET.value
+	_length = _META_HEADER_LENGTH + 5
 	attributes = ['hours', 'minutes', 'seconds', 'frames', 'sub_frames']
 
 	def __init__(self, hours: int, minutes: int, seconds: int, frames: int, sub_frames: int):
@@ -239,22 +325,26 @@ class MessageMetaSMPTEOffset(BaseMessageMeta):
 		self.sub_frames = sub_frames
 
 	@classmethod
-	def from_bytes(cls, data: bytes):
+	def from_bytes(cls, data: Union[bytes, memoryview]):
 		meta_message_type, data, remaining_data = cls._get_meta_message_data(data)
-		assert len(data) == 5, f"Expected 5 bytes, got {len(data)}"
-		return cls(*struct.unpack('>BBBBB', data)), remaining_data
-
-	def get_length(self) -> int:
-		return super().get_length() + 5
+		return cls(*_SMPTE_OFFSET_STRUCT.unpack(data)), remaining_data
 
 	def to_bytes(self) -> bytes:
 		return (
 			self._header_to_bytes()
-			+ struct.pack('>BBBBB', self.hours, self.minutes, self.seconds, self.frames, self.sub_frames)
+			+ _SMPTE_OFFSET_STRUCT.pack(self.hours, self.minutes, self.seconds, self.frames, self.sub_frames)
 		)
 
 class MessageMetaTimeSignature(BaseMessageMeta):
-	meta_message_type = MetaMessageType.TIME_SIGNATURE
+	__slots__ = (
+		'numerator',
+		'denominator',
+		'clocks_per_metronome_click',
+		'number_of_32nd_notes_per_quarter_note',
+	)
+
+	meta_message_type = MetaMessageType.TIME_SIGNATURE.value
+	_length = _META_HEADER_LENGTH + 4
 	attributes = [
 		'numerator',
 		'denominator',
@@ -271,23 +361,22 @@ class MessageMetaTimeSignature(BaseMessageMeta):
 		self.number_of_32nd_notes_per_quarter_note = number_of_32nd_notes_per_quarter_note
 
 	@classmethod
-	def from_bytes(cls, data: bytes):
+	def from_bytes(cls, data: Union[bytes, memoryview]):
 		meta_message_type, data, remaining_data = cls._get_meta_message_data(data)
-		assert len(data) == 4, f"Expected 4 bytes, got {len(data)}"
-		return cls(*struct.unpack('>BBBB', data)), remaining_data
-
-	def get_length(self) -> int:
-		return super().get_length() + 4
+		return cls(*_TIME_SIGNATURE_STRUCT.unpack(data)), remaining_data
 
 	def to_bytes(self) -> bytes:
 		return (
 			self._header_to_bytes()
-			+ struct.pack('>BBBB', self.numerator, self.denominator,
+			+ _TIME_SIGNATURE_STRUCT.pack(self.numerator, self.denominator,
 					self.clocks_per_metronome_click, self.number_of_32nd_notes_per_quarter_note)
 		)
 
 class MessageMetaKeySignature(BaseMessageMeta):
-	meta_message_type = MetaMessageType.KEY_SIGNATURE
+	__slots__ = ('key_signature', 'scale')
+
+	meta_message_type = MetaMessageType.KEY_SIGNATURE.value
+	_length = _META_HEADER_LENGTH + 2
 	attributes = ['key_signature', 'scale']
 
 	def __init__(self, key_signature: int, scale: int):
@@ -296,22 +385,20 @@ class MessageMetaKeySignature(BaseMessageMeta):
 		self.scale = scale
 
 	@classmethod
-	def from_bytes(cls, data: bytes):
+	def from_bytes(cls, data: Union[bytes, memoryview]):
 		meta_message_type, data, remaining_data = cls._get_meta_message_data(data)
-		assert len(data) == 2, f"Expected 2 bytes, got {len(data)}"
-		return cls(*struct.unpack('>BB', data)), remaining_data
+		return cls(*_KEY_SIGNATURE_STRUCT.unpack(data)), remaining_data
 	
-	def get_length(self) -> int:
-		return super().get_length() + 2
-
 	def to_bytes(self) -> bytes:
 		return (
 			self._header_to_bytes()
-			+ struct.pack('>BB', self.key_signature, self.scale)
+			+ _KEY_SIGNATURE_STRUCT.pack(self.key_signature, self.scale)
 		)
 
 class MessageMetaSequencerSpecific(BaseMessageMeta):
-	meta_message_type = MetaMessageType.SEQUENCER_SPECIFIC
+	__slots__ = ('data',)
+
+	meta_message_type = MetaMessageType.SEQUENCER_SPECIFIC.value
 	attributes = ['data']
 
 	def __init__(self, data: bytes):
@@ -319,85 +406,76 @@ class MessageMetaSequencerSpecific(BaseMessageMeta):
 		self.data = data
 
 	@classmethod
-	def from_bytes(cls, data: bytes):
+	def from_bytes(cls, data: Union[bytes, memoryview]):
 		meta_message_type, data, remaining_data = cls._get_meta_message_data(data)
-		return cls(data), remaining_data
+		return cls(bytes(data)), remaining_data
 
 	def get_length(self) -> int:
-		return super().get_length() + len(self.data)
+		return _META_HEADER_LENGTH + len(self.data)
 
 	def to_bytes(self) -> bytes:
 		return self._header_to_bytes() + self.data
 
 class MessageMetaUnknown(BaseMessageMeta):
-	meta_message_type = MetaMessageType.UNKNOWN
+	__slots__ = ('type_byte', 'data')
+
+	meta_message_type = MetaMessageType.UNKNOWN.value
 	attributes = ['type_byte', 'data']
 
 	def __init__(self, type_byte: int, data: bytes):
+		"""Initialize a meta message of unknown type."""
 		self.type_byte = type_byte
 		self.data = data
 
+	@classmethod
+	def _assert_meta_message_type(cls, meta_message_type: int):
+		if meta_message_type in ALL_META_MESSAGE_TYPES:
+			raise Exception("Using unknown meta message type on a well known type")
+
 	def _header_to_bytes(self) -> bytes:
-		return (
-			bytes(struct.pack(">BB", self.get_status_byte(), self.type_byte))
-			+ bytes(VariableInt.to_bytes(self.get_length() - 2))
-		)
+		return self._make_header_bytes(self.type_byte)
 
 	@classmethod
-	def from_bytes(cls, data: bytes):
+	def from_bytes(cls, data: Union[bytes, memoryview]):
 		meta_message_type, data, remaining_data = cls._get_meta_message_data(data)
-		return cls(meta_message_type, data), remaining_data
+		return cls(meta_message_type, bytes(data)), remaining_data
 
 	def get_length(self) -> int:
-		return super().get_length() + len(self.data)
+		return _META_HEADER_LENGTH + len(self.data)
 
 	def to_bytes(self) -> bytes:
 		return self._header_to_bytes() + self.data
 
-def meta_message_from_bytes(data: bytes) -> Tuple[BaseMessageMeta, bytes]:
-	"""Get a meta message object from bytes."""
-	message: BaseMessageMeta = None
-	remaining_data = None
-
-	message_status = data[0]
-
-	assert message_status == META_MESSAGE_VALUE, "Invalid meta message type"
-
-	meta_message_type = data[1]
-	try:
-		meta_message_type = MetaMessageType(meta_message_type)
-	except ValueError:
-		meta_message_type = MetaMessageType.UNKNOWN
-
-	if meta_message_type == MetaMessageType.TEXT:
-		message, remaining_data = MessageMetaText.from_bytes(data)
-	elif meta_message_type == MetaMessageType.COPYRIGHT_NOTICE:
-		message, remaining_data = MessageMetaCopyrightNotice.from_bytes(data)
-	elif meta_message_type == MetaMessageType.TRACK_NAME:
-		message, remaining_data = MessageMetaTrackName.from_bytes(data)
-	elif meta_message_type == MetaMessageType.INSTRUMENT_NAME:
-		message, remaining_data = MessageMetaInstrumentName.from_bytes(data)
-	elif meta_message_type == MetaMessageType.LYRIC:
-		message, remaining_data = MessageMetaLyric.from_bytes(data)
-	elif meta_message_type == MetaMessageType.MARKER:
-		message, remaining_data = MessageMetaMarker.from_bytes(data)
-	elif meta_message_type == MetaMessageType.CUE_POINT:
-		message, remaining_data = MessageMetaCuePoint.from_bytes(data)
-	elif meta_message_type == MetaMessageType.CHANNEL_PREFIX:
-		message, remaining_data = MessageMetaChannelPrefix.from_bytes(data)
-	elif meta_message_type == MetaMessageType.END_OF_TRACK:
-		message, remaining_data = MessageMetaEndOfTrack.from_bytes(data)
-	elif meta_message_type == MetaMessageType.SET_TEMPO:
-		message, remaining_data = MessageMetaSetTempo.from_bytes(data)
-	elif meta_message_type == MetaMessageType.SMPTE_OFFSET:
-		message, remaining_data = MessageMetaSMPTEOffset.from_bytes(data)
-	elif meta_message_type == MetaMessageType.TIME_SIGNATURE:
-		message, remaining_data = MessageMetaTimeSignature.from_bytes(data)
-	elif meta_message_type == MetaMessageType.KEY_SIGNATURE:
-		message, remaining_data = MessageMetaKeySignature.from_bytes(data)
-	elif meta_message_type == MetaMessageType.SEQUENCER_SPECIFIC:
-		message, remaining_data = MessageMetaSequencerSpecific.from_bytes(data)
-	elif meta_message_type == MetaMessageType.UNKNOWN:
-		message, remaining_data = MessageMetaUnknown.from_bytes(data)
-
-	return message, remaining_data
+META_MESSAGE_TYPES: Dict[int, Type[BaseMessageMeta]] = {
+	MetaMessageType.SEQUENCE_NUMBER.value: MessageMetaSequenceNumber,
+	MetaMessageType.TEXT.value: MessageMetaText,
+	MetaMessageType.COPYRIGHT_NOTICE.value: MessageMetaCopyrightNotice,
+	MetaMessageType.TRACK_NAME.value: MessageMetaTrackName,
+	MetaMessageType.INSTRUMENT_NAME.value: MessageMetaInstrumentName,
+	MetaMessageType.LYRIC.value: MessageMetaLyric,
+	MetaMessageType.MARKER.value: MessageMetaMarker,
+	MetaMessageType.CUE_POINT.value: MessageMetaCuePoint,
+	MetaMessageType.CHANNEL_PREFIX.value: MessageMetaChannelPrefix,
+	MetaMessageType.END_OF_TRACK.value: MessageMetaEndOfTrack,
+	MetaMessageType.SET_TEMPO.value: MessageMetaSetTempo,
+	MetaMessageType.SMPTE_OFFSET.value: MessageMetaSMPTEOffset,
+	MetaMessageType.TIME_SIGNATURE.value: MessageMetaTimeSignature,
+	MetaMessageType.KEY_SIGNATURE.value: MessageMetaKeySignature,
+	MetaMessageType.SEQUENCER_SPECIFIC.value: MessageMetaSequencerSpecific,
+}
+
+# Bound once, to skip the attribute lookup for every meta message
+_get_meta_message_class = META_MESSAGE_TYPES.get
+
+def meta_message_from_bytes(data: Union[bytes, memoryview]) -> Tuple[BaseMessageMeta, memoryview]:
+	"""
+	Get a meta message object from bytes.
+
+	Returns the message object and the remaining bytes, as a memoryview of data.
+	"""
+	data = memoryview(data)
+
+	assert data[0] == META_MESSAGE_VALUE, "Invalid meta message type"
+
+	# Keyed by the raw meta message type byte, anything else is unknown
+	return _get_meta_message_class(data[1], MessageMetaUnknown).from_bytes(data)
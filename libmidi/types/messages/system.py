@@ -6,9 +6,9 @@
 """MIDI system message."""
 
 from enum import IntEnum
-from typing import Tuple
+from typing import Dict, Tuple, Type, Union
 
-from libmidi.utils.bytes import get_data_from_bytes
+from libmidi.utils.bytes import find_byte
 from libmidi.types.messages.common import BaseMessage, MessageType
 
 SYSTEM_MESSAGE_VALUE = 0xF
@@ -22,18 +22,31 @@ class SystemMessageType(IntEnum):
 	TUNE_REQUEST = 0xF6
 	END_OF_EXCLUSIVE = 0xF7
 
-ALL_SYSTEM_MESSAGE_TYPES = [
+ALL_SYSTEM_MESSAGE_TYPES = frozenset({
 	SystemMessageType.SYSTEM_EXCLUSIVE,
 	SystemMessageType.TIME_CODE_QUARTER_FRAME,
 	SystemMessageType.SONG_POSITION_POINTER,
 	SystemMessageType.SONG_SELECT,
 	SystemMessageType.TUNE_REQUEST,
-]
+})
+
+_END_OF_EXCLUSIVE_BYTES = bytes((SystemMessageType.END_OF_EXCLUSIVE,))
 
 class BaseMessageSystem(BaseMessage):
+	__slots__ = ()
+
 	message_type = MessageType.SYSTEM
 	system_message_type: SystemMessageType
 
+	# The status byte alone, reused by to_bytes() instead of building it for every message
+	_status_bytes: bytes
+
+	def __init_subclass__(cls, **kwargs):
+		"""Precompute the status byte of a system message class."""
+		super().__init_subclass__(**kwargs)
+
+		cls._status_bytes = bytes((cls.system_message_type,))
+
 	def __str__(self) -> str:
 		"""Return a string representation of the message."""
 		return (
@@ -44,11 +57,14 @@ class BaseMessageSystem(BaseMessage):
 	def get_status_byte(self):
 		return self.system_message_type
 
+	# Fixed size messages read their bytes by index and only call this in debug mode
 	@classmethod
 	def _assert_status_byte(cls, status_byte: int):
 		assert status_byte == cls.system_message_type, ("Invalid system message type")
 
 class MessageSystemExclusive(BaseMessageSystem):
+	__slots__ = ('data',)
+
 	system_message_type = SystemMessageType.SYSTEM_EXCLUSIVE
 	attributes = ["data"]
 
@@ -60,21 +76,21 @@ class MessageSystemExclusive(BaseMessageSystem):
 		return super().get_length() + len(self.data)
 
 	@classmethod
-	def from_bytes(cls, data: bytes):
+	def from_bytes(cls, data: Union[bytes, memoryview]):
 		_, _, remaining_data = cls._get_status_data(data)
 
-		data_length = 0
-		while remaining_data[data_length] != SystemMessageType.END_OF_EXCLUSIVE:
-			data_length += 1
+		data_length = find_byte(remaining_data, SystemMessageType.END_OF_EXCLUSIVE)
+		if data_length < 0:
+			raise ValueError("Unterminated system exclusive message")
 
-		data, remaining_data = get_data_from_bytes(remaining_data, data_length + 1)
-
-		return cls(data[:-1]), remaining_data
+		return cls(bytes(remaining_data[:data_length])), remaining_data[data_length + 1:]
 
 	def to_bytes(self) -> bytes:
-		return bytes([self.get_status_byte()]) + self.data + bytes([SystemMessageType.END_OF_EXCLUSIVE])
+		return b''.join((self._status_bytes, self.data, _END_OF_EXCLUSIVE_BYTES))
 
 class MessageSystemTimeCodeQuarterFrame(BaseMessageSystem):
+	__slots__ = ('timecode_message_type', 'values')
+
 	system_message_type = SystemMessageType.TIME_CODE_QUARTER_FRAME
 	attributes = ["timecode_message_type", "values"]
 
@@ -84,20 +100,22 @@ class MessageSystemTimeCodeQuarterFrame(BaseMessageSystem):
 		self.values = values
 
 	@classmethod
-	def from_bytes(cls, data: bytes):
-		_, _, remaining_data = cls._get_status_data(data)
+	def from_bytes(cls, data: Union[bytes, memoryview]):
+		data = memoryview(data)
 
-		data, remaining_data = get_data_from_bytes(remaining_data, 1)
-		data = data[0]
+		if __debug__:
+			cls._assert_status_byte(data[0])
 
-		timecode_message_type, values = data >> 4, data & 0x0F
+		timecode_message_type, values = data[1] >> 4, data[1] & 0x0F
 
-		return cls(timecode_message_type, values), remaining_data
+		return cls(timecode_message_type, values), data[2:]
 
 	def to_bytes(self) -> bytes:
 		return bytes([self.get_status_byte(), (self.timecode_message_type << 4) | self.values])
 
 class MessageSystemSongPositionPointer(BaseMessageSystem):
+	__slots__ = ('position',)
+
 	system_message_type = SystemMessageType.SONG_POSITION_POINTER
 	attributes = ["position"]
 
@@ -106,18 +124,22 @@ class MessageSystemSongPositionPointer(BaseMessageSystem):
 		self.position = position
 
 	@classmethod
-	def from_bytes(cls, data: bytes):
-		_, _, remaining_data = cls._get_status_data(data)
+	def from_bytes(cls, data: Union[bytes, memoryview]):
+		data = memoryview(data)
 
-		data, remaining_data = get_data_from_bytes(remaining_data, 2)
-		position = data[0] | (data[1] << 7)
+		if __debug__:
+			cls._assert_status_byte(data[0])
 
-		return cls(position), remaining_data
+		position = data[1] | (data[2] << 7)
+
+		return cls(position), data[3:]
 
 	def to_bytes(self) -> bytes:
 		return bytes([self.get_status_byte(), self.position & 0x7F, (self.position >> 7) & 0x7F])
 
 class MessageSystemSongSelect(BaseMessageSystem):
+	__slots__ = ('song_number',)
+
 	system_message_type = SystemMessageType.SONG_SELECT
 	attributes = ["song_number"]
 
@@ -126,46 +148,50 @@ class MessageSystemSongSelect(BaseMessageSystem):
 		self.song_number = song_number
 
 	@classmethod
-	def from_bytes(cls, data: bytes):
-		_, _, remaining_data = cls._get_status_data(data)
+	def from_bytes(cls, data: Union[bytes, memoryview]):
+		data = memoryview(data)
 
-		data, remaining_data = get_data_from_bytes(remaining_data, 1)
-		song_number = (data[0] << 7)
+		if __debug__:
+			cls._assert_status_byte(data[0])
 
-		return cls(song_number), remaining_data
+		song_number = data[1] & 0x7F
+
+		return cls(song_number), data[2:]
 
 	def to_bytes(self) -> bytes:
 		return bytes([self.get_status_byte(), self.song_number & 0x7F])
 
 class MessageSystemTuneRequest(BaseMessageSystem):
+	__slots__ = ()
+
 	system_message_type = SystemMessageType.TUNE_REQUEST
 
 	@classmethod
-	def from_bytes(cls, data: bytes):
-		_, _, remaining_data = cls._get_status_data(data)
+	def from_bytes(cls, data: Union[bytes, memoryview]):
+		data = memoryview(data)
 
-		return cls(), remaining_data
+		if __debug__:
+			cls._assert_status_byte(data[0])
+
+		return cls(), data[1:]
 
 	def to_bytes(self) -> bytes:
-		return bytes([self.get_status_byte()])
-
-def system_message_from_bytes(data: bytes) -> Tuple[BaseMessageSystem, bytes]:
-	message: BaseMessage = None
-	remaining_data = None
-
-	message_status = data[0]
-
-	if message_status == SystemMessageType.SYSTEM_EXCLUSIVE:
-		message, remaining_data = MessageSystemExclusive.from_bytes(data)
-	elif message_status == SystemMessageType.TIME_CODE_QUARTER_FRAME:
-		message, remaining_data = MessageSystemTimeCodeQuarterFrame.from_bytes(data)
-	elif message_status == SystemMessageType.SONG_POSITION_POINTER:
-		message, remaining_data = MessageSystemSongPositionPointer.from_bytes(data)
-	elif message_status == SystemMessageType.SONG_SELECT:
-		message, remaining_data = MessageSystemSongSelect.from_bytes(data)
-	elif message_status == SystemMessageType.TUNE_REQUEST:
-		message, remaining_data = MessageSystemTuneRequest.from_bytes(data)
-	else:
-		raise ValueError(f"Invalid system message type {message_status}")
-
-	return message, remaining_data
+		return self._status_bytes
+
+SYSTEM_MESSAGE_TYPES: Dict[int, Type[BaseMessageSystem]] = {
+	SystemMessageType.SYSTEM_EXCLUSIVE.value: MessageSystemExclusive,
+	SystemMessageType.TIME_CODE_QUARTER_FRAME.value: MessageSystemTimeCodeQuarterFrame,
+	SystemMessageType.SONG_POSITION_POINTER.value: MessageSystemSongPositionPointer,
+	SystemMessageType.SONG_SELECT.value: MessageSystemSongSelect,
+	SystemMessageType.TUNE_REQUEST.value: MessageSystemTuneRequest,
+}
+
+def system_message_from_bytes(data: Union[bytes, memoryview]) -> Tuple[BaseMessageSystem, memoryview]:
+	"""Get a system message from bytes."""
+	# Keyed by the raw status byte
+	message_class = SYSTEM_MESSAGE_TYPES.get(data[0])
+
+	if not message_class:
+		raise ValueError(f"Invalid system message type {data[0]}")
+
+	return message_class.from_bytes(data)
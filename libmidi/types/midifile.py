@@ -6,6 +6,7 @@
 """MIDI file."""
 
 from io import BufferedReader
+from operator import attrgetter, itemgetter
 from pathlib import Path
 import time
 from typing import List, Union
@@ -14,7 +15,7 @@ from libmidi.types.event import Event
 from libmidi.types.header import Header
 from libmidi.types.messages.meta import BaseMessageMeta, MessageMetaEndOfTrack, MessageMetaSetTempo
 from libmidi.types.track import Track
-from libmidi.utils.time import tick2second, to_abstime, to_reltime
+from libmidi.utils.time import to_abstime, to_reltime_inplace
 
 # The default tempo is 120 BPM.
 # (500000 microseconds per beat (quarter note).)
@@ -49,19 +50,19 @@ class MidiFile:
 		if self.format == 2:
 			raise TypeError("can't merge tracks in format 2 (asynchronous) file")
 
-		tempo = DEFAULT_TEMPO
+		# Same as tick2second(), with the scale only recomputed on tempo changes
+		scale = DEFAULT_TEMPO * 1e-6 / self.division
 		for event in self.merge_tracks().events:
-			# Convert message time from absolute time
-			# in ticks to relative time in seconds.
+			# Convert message time in ticks to time in seconds.
 			if event.delta_time > 0:
-				delta = tick2second(event.delta_time, self.division, tempo)
+				delta = event.delta_time * scale
 			else:
 				delta = 0
 
 			yield event.copy(delta_time=delta)
 
 			if isinstance(event.message, MessageMetaSetTempo):
-				tempo = event.message.tempo
+				scale = event.message.tempo * 1e-6 / self.division
 
 	@classmethod
 	def from_stream(cls, stream: BufferedReader) -> 'MidiFile':
@@ -77,16 +78,43 @@ class MidiFile:
 
 		return cls(header.format, tracks, header.division)
 
+	@classmethod
+	def from_buffer(cls, buffer: Union[bytes, memoryview]) -> 'MidiFile':
+		"""Read a MIDI file from a buffer (bytes, memoryview, mmap...)."""
+		tracks = []
+
+		header, offset = Header.from_buffer(buffer)
+
+		for _ in range(header.ntrks):
+			track, offset = Track.from_buffer(buffer, offset)
+
+			tracks.append(track)
+
+		return cls(header.format, tracks, header.division)
+
+	@classmethod
+	def from_bytes(cls, data: bytes) -> 'MidiFile':
+		"""Read a MIDI file from bytes."""
+		# Track data are views of data instead of copies
+		return cls.from_buffer(memoryview(data))
+
 	@classmethod
 	def from_file(cls, filename: Union[Path, str]) -> 'MidiFile':
 		"""Read a MIDI file from a file."""
-		with Path(filename).open('rb') as f:
-			return cls.from_stream(f)
+		# Read the whole file at once and walk it by offset instead of
+		# issuing a read for every chunk header and payload
+		return cls.from_bytes(Path(filename).read_bytes())
 
 	def to_bytes(self) -> bytes:
 		"""Return the MIDI file as a byte string."""
-		header = Header(self.format, self.division, len(self.tracks))
-		return header.to_bytes() + b''.join(track.to_bytes() for track in self.tracks)
+		header = Header(self.format, len(self.tracks), self.division)
+
+		# Tracks are written into a single buffer, copied only once at the end
+		buffer = bytearray(header.to_bytes())
+		for track in self.tracks:
+			track.write_into(buffer)
+
+		return bytes(buffer)
 
 	def to_file(self, filename: Union[Path, str]) -> int:
 		"""
@@ -107,7 +135,32 @@ class MidiFile:
 		if self.format == 2:
 			raise ValueError('impossible to compute length for type 2 (asynchronous) file')
 
-		return sum(event.delta_time for event in self)
+		# Only the tempo changes and the end of the longest track matter,
+		# the events don't need to be merged and copied like __iter__() does
+		tempo_changes = []
+		end = 0
+		for track in self.tracks:
+			now = 0
+			for event in track.events:
+				now += event.delta_time
+				if isinstance(event.message, MessageMetaSetTempo):
+					tempo_changes.append((now, event.message.tempo))
+			end = max(end, now)
+
+		# Stable, so simultaneous changes apply in the same order as when merging
+		tempo_changes.sort(key=itemgetter(0))
+
+		# Sum ticks times tempo for every constant tempo span, then scale once
+		length = 0
+		tick = 0
+		tempo = DEFAULT_TEMPO
+		for change_tick, change_tempo in tempo_changes:
+			length += (change_tick - tick) * tempo
+			tick = change_tick
+			tempo = change_tempo
+		length += (end - tick) * tempo
+
+		return length * 1e-6 / self.division
 
 	def play(self, meta_messages: bool = False):
 		"""
@@ -176,6 +229,11 @@ class MidiFile:
 		for track in self.tracks:
 			events.extend(to_abstime(track.events))
 
-		events.sort(key=lambda event: event.delta_time)
+		# Every track is already sorted, and timsort merges these runs in O(n log k)
+		# in C, which is several times faster than heapq.merge()'s Python generator
+		events.sort(key=attrgetter("delta_time"))
+
+		# The events are already copies owned by this list, convert them back in place
+		to_reltime_inplace(events)
 
-		return Track(events=self._fix_end_of_track(to_reltime(events)))
+		return Track(events=list(self._fix_end_of_track(events)))
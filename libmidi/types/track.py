@@ -5,11 +5,16 @@
 #
 """MIDI track."""
 
+from array import array
 from io import BufferedReader
-from typing import List
+from operator import attrgetter
+from typing import Dict, List, Tuple, Union
 
 from libmidi.types.chunk import Chunk
 from libmidi.types.event import Event
+from libmidi.types.message import MESSAGE_DISPATCH, RUNNING_STATUS_DISPATCH
+from libmidi.types.messages.common import MessageType
+from libmidi.utils.variable_length import VariableInt
 
 class Track:
 	"""
@@ -24,27 +29,119 @@ class Track:
 		"""Initialize a track."""
 		self.events = events or []
 
+	@classmethod
+	def from_buffer(cls, buffer: Union[bytes, memoryview], offset: int = 0) -> Tuple['Track', int]:
+		"""
+		Read a track from a buffer at the given offset.
+
+		Returns the track and the offset following it.
+		"""
+		chunk, offset = Chunk.from_buffer(buffer, offset)
+
+		return cls.from_chunk(chunk), offset
+
 	@classmethod
 	def from_stream(cls, stream: BufferedReader) -> 'Track':
 		"""Read a track from a stream."""
-		events = []
-		chunk = Chunk.from_stream(stream)
+		return cls.from_chunk(Chunk.from_stream(stream))
+
+	@classmethod
+	def from_chunk(cls, chunk: Chunk) -> 'Track':
+		"""Read a track from a MTrk chunk."""
+		events: List[Event] = []
 
 		assert chunk.name == cls.HEADER, "Invalid track chunk type"
 
-		data = chunk.data
+		data: Union[bytes, memoryview] = memoryview(chunk.data)
 		last_status_byte: int = None
+
+		# Bind what the loop calls to locals, it runs for every event of the file
+		read_delta_time = VariableInt.from_bytes
+		message_decoders = MESSAGE_DISPATCH
+		running_status_decoders = RUNNING_STATUS_DISPATCH
+		append_event = events.append
 		while data:
-			event, data = Event.from_bytes(data, last_status_byte)
-			last_status_byte = event.message.get_status_byte()
-			events.append(event)
+			# Same as Event.from_bytes() and message_from_bytes(),
+			# inlined since this runs for every event
+			delta_time, data = read_delta_time(data)
+
+			status_byte = data[0]
+			if status_byte < 0x80:
+				# Running status, no status byte to consume
+				message, data = running_status_decoders[last_status_byte or 0](data)
+			else:
+				# Remember the status byte for running status straight from the data,
+				# instead of asking the decoded message for it.
+				# Only channel messages set it, so that it survives interleaved
+				# meta and system messages like most writers expect
+				if status_byte < 0xF0:
+					last_status_byte = status_byte
+
+				message, data = message_decoders[status_byte](data)
+
+			append_event(Event(delta_time, message))
 
 		return cls(events)
 
+	def to_arrays(self) -> Dict[str, array]:
+		"""
+		Return the events of the track as columns.
+
+		Returns a dict of arrays with the delta time ('delta_time'), the status byte ('status')
+		and the data bytes ('data1', 'data2') of every event, in track order.
+		Data bytes are 0 for meta and system messages, and 'data2' is 0 for
+		channel messages with only one data byte.
+
+		The arrays support the buffer protocol, so they can be used without a copy
+		(e.g. with numpy.frombuffer()).
+		"""
+		delta_times = array('Q', map(attrgetter('delta_time'), self.events))
+		statuses = array('B')
+		data1 = array('B')
+		data2 = array('B')
+
+		for message in map(attrgetter('message'), self.events):
+			statuses.append(message.get_status_byte())
+
+			if message.message_type is MessageType.CHANNEL:
+				# Padded, so that messages with one data byte get 0 in 'data2'
+				values = message._get_attribute_values(message) + (0,)
+				data1.append(values[0])
+				data2.append(values[1])
+			else:
+				data1.append(0)
+				data2.append(0)
+
+		return {
+			'delta_time': delta_times,
+			'status': statuses,
+			'data1': data1,
+			'data2': data2,
+		}
+
 	def to_bytes(self) -> bytes:
 		"""Write a track to bytes."""
-		chunk = Chunk(name=self.HEADER, data=b''.join(event.to_bytes() for event in self.events))
-		return chunk.to_bytes()
+		buffer = bytearray()
+		self.write_into(buffer)
+		return bytes(buffer)
+
+	def write_into(self, buffer: bytearray):
+		"""
+		Append the track chunk to a buffer.
+
+		Events are appended in place, and the chunk header is filled in once
+		the data length is known, so no intermediate chunk data is built.
+		"""
+		start = len(buffer)
+		buffer += bytes(Chunk.HEADER_SIZE)
+
+		write_delta_time = VariableInt.to_bytes
+		for event in self.events:
+			# Same as Event.to_bytes(), without joining the two parts first
+			buffer += write_delta_time(event.delta_time)
+			buffer += event.message.to_bytes()
+
+		Chunk.pack_header_into(buffer, start, self.HEADER, len(buffer) - start - Chunk.HEADER_SIZE)
 
 	def to_stream(self, stream: BufferedReader) -> int:
 		"""
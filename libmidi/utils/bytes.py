@@ -5,8 +5,28 @@
 #
 """bytes utils."""
 
-from typing import Tuple
+from typing import Tuple, Union
 
-def get_data_from_bytes(data: bytes, size: int) -> Tuple[bytes, bytes]:
-	"""Pop footer bytes from data and return the rest."""
+def get_data_from_bytes(data: Union[bytes, memoryview], size: int) -> Tuple[memoryview, memoryview]:
+	"""
+	Pop footer bytes from data and return the rest.
+
+	Slices are memoryviews of the original data, so no copy is made.
+	"""
+	data = memoryview(data)
 	return data[:size], data[size:]
+
+def find_byte(data: Union[bytes, memoryview], value: int) -> int:
+	"""
+	Return the index of the first occurrence of value in data, or -1 if missing.
+
+	memoryview has no find(), so data is copied to bytes in windows of doubling
+	size and searched with bytes.find(), keeping the copies proportional to the
+	position of the match instead of the length of data.
+	"""
+	size = 64
+	while True:
+		index = bytes(data[:size]).find(value)
+		if index >= 0 or size >= len(data):
+			return index
+		size *= 2
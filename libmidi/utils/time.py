@@ -24,6 +24,14 @@ def to_reltime(events: List[Event]):
 		yield event.copy(delta_time=delta)
 		now = event.delta_time
 
+def to_reltime_inplace(events: List[Event]):
+	"""Convert messages to relative time, modifying the events instead of copying them."""
+	now = 0
+	for event in events:
+		delta = event.delta_time - now
+		now = event.delta_time
+		event.delta_time = delta
+
 def tick2second(tick, ticks_per_beat, tempo):
 	"""
 	Convert absolute time in ticks to seconds.
@@ -6,26 +6,55 @@
 """MIDI variable-length quantity utils."""
 
 from io import BufferedReader
-from typing import Tuple
+from typing import Tuple, Union
+
+# Encoded single byte values, returned as is instead of building a new bytes object
+_SINGLE_BYTE_VALUES = tuple(bytes((value,)) for value in range(0x80))
 
 class VariableInt:
 	"""MIDI variable-length quantity utils."""
 
 	@staticmethod
-	def from_bytes(data: bytes) -> Tuple[int, bytes]:
+	def from_bytes(data: Union[bytes, memoryview]) -> Tuple[int, Union[bytes, memoryview]]:
 		"""
 		Read a variable-length quantity from bytes.
 		
 		Returns the value and the remaining bytes.
 		"""
-		delta = 0
+		# Most delta times fit in a single byte, skip the call for those
+		if data and data[0] < 0x80:
+			return data[0], data[1:]
 
-		while True:
-			byte = int.from_bytes(data[0:1], 'big')
+		delta, offset = VariableInt.from_buffer(data)
+
+		return delta, data[offset:]
+
+	@staticmethod
+	def from_buffer(data: Union[bytes, memoryview], offset: int = 0) -> Tuple[int, int]:
+		"""
+		Read a variable-length quantity from a buffer at the given offset.
+
+		Returns the value and the offset following it.
+		"""
+		try:
+			byte = data[offset]
+		except IndexError:
+			raise EOFError('unexpected end of data in variable int') from None
+
+		# Most delta times fit in a single byte, and almost all the others in two
+		if byte < 0x80:
+			return byte, offset + 1
+		if offset + 1 < len(data) and data[offset + 1] < 0x80:
+			return ((byte & 0x7f) << 7) | data[offset + 1], offset + 2
+
+		delta = byte & 0x7f
+		for offset in range(offset + 1, len(data)):
+			byte = data[offset]
 			delta = (delta << 7) | (byte & 0x7f)
 			if byte < 0x80:
-				return delta, data[1:]
-			data = data[1:]
+				return delta, offset + 1
+
+		raise EOFError('unexpected end of data in variable int')
 
 	@staticmethod
 	def from_stream(buffer: BufferedReader) -> int:
@@ -33,7 +62,11 @@ class VariableInt:
 		delta = 0
 
 		while True:
-			byte = int.from_bytes(buffer.read(1), 'big')
+			data = buffer.read(1)
+			if not data:
+				raise EOFError('unexpected end of stream in variable int')
+
+			byte = data[0]
 			delta = (delta << 7) | (byte & 0x7f)
 			if byte < 0x80:
 				return delta
@@ -44,6 +77,21 @@ class VariableInt:
 		if value < 0:
 			raise ValueError('variable int must be a non-negative integer')
 
+		# MIDI only uses up to 4 bytes, unroll those and keep the loop for the rest
+		if value < 0x80:
+			return _SINGLE_BYTE_VALUES[value]
+		if value < 0x4000:
+			return bytes((0x80 | (value >> 7), value & 0x7f))
+		if value < 0x200000:
+			return bytes((0x80 | (value >> 14), 0x80 | ((value >> 7) & 0x7f), value & 0x7f))
+		if value < 0x10000000:
+			return bytes((
+				0x80 | (value >> 21),
+				0x80 | ((value >> 14) & 0x7f),
+				0x80 | ((value >> 7) & 0x7f),
+				value & 0x7f,
+			))
+
 		bytes_list = []
 		while value:
 			bytes_list.append(value & 0x7f)
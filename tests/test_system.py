@@ -0,0 +1,23 @@
+#
+# Copyright (C) 2022 Sebastiano Barezzi
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+#
+"""MIDI system message tests."""
+
+import unittest
+
+from libmidi.types.messages.system import MessageSystemSongSelect
+
+class TestMessageSystemSongSelect(unittest.TestCase):
+	def test_round_trip(self):
+		data = MessageSystemSongSelect(5).to_bytes()
+		self.assertEqual(data, b'\xf3\x05')
+
+		message, remaining_data = MessageSystemSongSelect.from_bytes(data + b'\xf6')
+		self.assertEqual(message.song_number, 5)
+		self.assertEqual(bytes(remaining_data), b'\xf6')
+		self.assertEqual(message.to_bytes(), data)
+
+if __name__ == '__main__':
+	unittest.main()